@@ -79,8 +79,8 @@ class CapsuleArtist(BlenderArtist, ShapeArtist):
             The objects created in Blender.
 
         """
-        u = u or self.u
-        v = v or self.v
+        u = u if u is not None else self.u
+        v = v if v is not None else self.v
         color = Color.coerce(color) or self.color
         vertices, faces = self.shape.to_vertices_and_faces(u=u, v=v)
         obj = compas_blender.draw_mesh(
@@ -77,7 +77,7 @@ class CylinderArtist(BlenderArtist, ShapeArtist):
             The objects created in Blender.
 
         """
-        u = u or self.u
+        u = u if u is not None else self.u
         color = Color.coerce(color) or self.color
         vertices, faces = self.shape.to_vertices_and_faces(u=u)
         obj = compas_blender.draw_mesh(
@@ -1,6 +1,7 @@
 from typing import Any
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import bpy
@@ -56,12 +57,31 @@ class FrameArtist(BlenderArtist, PrimitiveArtist):
 
         super().__init__(primitive=frame, collection=collection or frame.name, **kwargs)
 
-        self.scale = scale or 1.0
+        self.scale = scale if scale is not None else 1.0
         self.color_origin = Color.black()
         self.color_xaxis = Color.red()
         self.color_yaxis = Color.green()
         self.color_zaxis = Color.blue()
 
+    def _axes_endpoints(self) -> List[Tuple[float, float, float]]:
+        frame = self.primitive
+        scale = self.scale
+        x, y, z = frame.point
+        axes = frame.xaxis, frame.yaxis, frame.zaxis
+        if scale == 1.0:
+            return [(x, y, z)] + [(x + u, y + v, z + w) for u, v, w in axes]
+        return [(x, y, z)] + [(x + u * scale, y + v * scale, z + w * scale) for u, v, w in axes]
+
+    def clear(self) -> None:
+        """Delete all objects drawn by this artist.
+
+        Returns
+        -------
+        None
+
+        """
+        compas_blender.delete_objects(self.collection.objects)
+
     def draw(self) -> List[bpy.types.Object]:
         """Draw the frame.
 
@@ -70,7 +90,8 @@ class FrameArtist(BlenderArtist, PrimitiveArtist):
         list[:blender:`bpy.types.Object`]
 
         """
-        self.clear()
+        if self.collection.objects:
+            self.clear()
         objects = []
         objects += self.draw_origin()
         objects += self.draw_axes()
@@ -102,10 +123,7 @@ class FrameArtist(BlenderArtist, PrimitiveArtist):
         list[:blender:`bpy.types.Object`]
 
         """
-        origin = self.primitive.point
-        X = self.primitive.point + self.primitive.xaxis.scaled(self.scale)
-        Y = self.primitive.point + self.primitive.yaxis.scaled(self.scale)
-        Z = self.primitive.point + self.primitive.zaxis.scaled(self.scale)
+        origin, X, Y, Z = self._axes_endpoints()
         lines = [
             {
                 "start": origin,
@@ -216,7 +216,7 @@ class MeshArtist(BlenderArtist, MeshArtist):
 
         """
         self.vertex_color = color
-        vertices = vertices or self.vertices
+        vertices = vertices if vertices is not None else self.vertices
         points = []
         for vertex in vertices:
             points.append(
@@ -251,7 +251,7 @@ class MeshArtist(BlenderArtist, MeshArtist):
 
         """
         self.edge_color = color
-        edges = edges or self.edges
+        edges = edges if edges is not None else self.edges
         lines = []
         for edge in edges:
             u, v = edge
@@ -287,7 +287,7 @@ class MeshArtist(BlenderArtist, MeshArtist):
 
         """
         self.face_color = color
-        faces = faces or self.faces
+        faces = faces if faces is not None else self.faces
         facets = []
         for face in faces:
             facets.append(
@@ -326,7 +326,7 @@ class MeshArtist(BlenderArtist, MeshArtist):
         list[:blender:`bpy.types.Object`]
 
         """
-        vertices = vertices or self.vertices
+        vertices = vertices if vertices is not None else self.vertices
         lines = []
         for vertex in vertices:
             a = self.vertex_xyz[vertex]
@@ -365,7 +365,7 @@ class MeshArtist(BlenderArtist, MeshArtist):
         list[:blender:`bpy.types.Object`]
 
         """
-        faces = faces or self.faces
+        faces = faces if faces is not None else self.faces
         lines = []
         for face in faces:
             a = centroid_points([self.vertex_xyz[vertex] for vertex in self.mesh.face_vertices(face)])
@@ -206,7 +206,7 @@ class NetworkArtist(BlenderArtist, NetworkArtist):
 
         """
         self.node_color = color
-        nodes = nodes or self.nodes
+        nodes = nodes if nodes is not None else self.nodes
         points = []
         for node in nodes:
             points.append(
@@ -241,7 +241,7 @@ class NetworkArtist(BlenderArtist, NetworkArtist):
 
         """
         self.edge_color = color
-        edges = edges or self.edges
+        edges = edges if edges is not None else self.edges
         lines = []
         for edge in edges:
             u, v = edge
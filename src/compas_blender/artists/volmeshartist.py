@@ -197,7 +197,7 @@ class VolMeshArtist(BlenderArtist, VolMeshArtist):
 
         """
         self.vertex_color = color
-        vertices = vertices or self.vertices
+        vertices = vertices if vertices is not None else self.vertices
         points = []
         for vertex in vertices:
             points.append(
@@ -232,7 +232,7 @@ class VolMeshArtist(BlenderArtist, VolMeshArtist):
 
         """
         self.edge_color = color
-        edges = edges or self.edges
+        edges = edges if edges is not None else self.edges
         lines = []
         for edge in edges:
             u, v = edge
@@ -268,7 +268,7 @@ class VolMeshArtist(BlenderArtist, VolMeshArtist):
 
         """
         self.face_color = color
-        faces = faces or self.faces
+        faces = faces if faces is not None else self.faces
         facets = []
         for face in faces:
             facets.append(
@@ -302,7 +302,7 @@ class VolMeshArtist(BlenderArtist, VolMeshArtist):
 
         """
         self.cell_color = color
-        cells = cells or self.cells
+        cells = cells if cells is not None else self.cells
         vertex_xyz = self.vertex_xyz
         meshes = []
         for cell in cells:
@@ -348,7 +348,7 @@ class VolMeshArtist(BlenderArtist, VolMeshArtist):
         list[:blender:`bpy.types.Object`]
 
         """
-        vertices = vertices or self.vertices
+        vertices = vertices if vertices is not None else self.vertices
         lines = []
         for vertex in vertices:
             a = self.vertex_xyz[vertex]
@@ -387,7 +387,7 @@ class VolMeshArtist(BlenderArtist, VolMeshArtist):
         list[:blender:`bpy.types.Object`]
 
         """
-        faces = faces or self.faces
+        faces = faces if faces is not None else self.faces
         lines = []
         for face in faces:
             a = centroid_points([self.vertex_xyz[vertex] for vertex in self.mesh.face_vertices(face)])
@@ -42,7 +42,7 @@ class CylinderArtist(GHArtist, ShapeArtist):
 
         """
         color = Color.coerce(color) or self.color
-        u = u or self.u
+        u = u if u is not None else self.u
         vertices, faces = self.shape.to_vertices_and_faces(u=u)
         vertices = [list(vertex) for vertex in vertices]
         mesh = compas_ghpython.draw_mesh(vertices, faces, color=color.rgb255)
@@ -2,7 +2,6 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import Rhino
 import compas_ghpython
 from compas.artists import MeshArtist
 from .artist import GHArtist
@@ -39,7 +38,10 @@ class MeshArtist(GHArtist, MeshArtist):
 
         """
         self.color = color
-        vertices, faces = self.mesh.to_vertices_and_faces()
+        vertex_index = self.mesh.vertex_index()
+        vertex_xyz = self.vertex_xyz
+        vertices = [vertex_xyz[vertex] for vertex in self.mesh.vertices()]
+        faces = [[vertex_index[vertex] for vertex in self.mesh.face_vertices(face)] for face in self.mesh.faces()]
         return compas_ghpython.draw_mesh(vertices, faces, self.color.rgb255)
 
     def draw_mesh(self, color=None):
@@ -75,26 +77,16 @@ class MeshArtist(GHArtist, MeshArtist):
             Default is None, in which case all vertices are drawn.
         color : :class:`~compas.colors.Color` | dict[int, :class:`~compas.colors.Color`], optional
             The color specification for the vertices.
-            The default is the value of :attr:`MeshArtist.default_vertexcolor`.
+            Grasshopper points have no color, so this is ignored.
 
         Returns
         -------
         list[:rhino:`Rhino.Geometry.Point3d`]
 
         """
-        self.vertex_color = color
-        vertices = vertices or list(self.mesh.vertices())
+        vertices = vertices if vertices is not None else self.mesh.vertices()
         vertex_xyz = self.vertex_xyz
-        points = []
-        for vertex in vertices:
-            points.append(
-                {
-                    "pos": vertex_xyz[vertex],
-                    "name": "{}.vertex.{}".format(self.mesh.name, vertex),
-                    "color": self.vertex_color[vertex].rgb255,
-                }
-            )
-        return compas_ghpython.draw_points(points)
+        return compas_ghpython.draw_points([{"pos": vertex_xyz[vertex]} for vertex in vertices])
 
     def draw_faces(self, faces=None, color=None, join_faces=False):
         """Draw a selection of faces.
@@ -116,24 +108,17 @@ class MeshArtist(GHArtist, MeshArtist):
 
         """
         self.face_color = color
-        faces = faces or list(self.mesh.faces())
+        faces = faces if faces is not None else self.mesh.faces()
         vertex_xyz = self.vertex_xyz
-        facets = []
-        for face in faces:
-            facets.append(
-                {
-                    "points": [vertex_xyz[vertex] for vertex in self.mesh.face_vertices(face)],
-                    "name": "{}.face.{}".format(self.mesh.name, face),
-                    "color": self.face_color[face].rgb255,
-                }
-            )
-        meshes = compas_ghpython.draw_faces(facets)
-        if not join_faces:
-            return meshes
-        joined_mesh = Rhino.Geometry.Mesh()
-        for mesh in meshes:
-            joined_mesh.Append(mesh)
-        return [joined_mesh]
+        face_color = self.face_color
+        facets = [
+            {
+                "points": [vertex_xyz[vertex] for vertex in self.mesh.face_vertices(face)],
+                "color": face_color[face].rgb255,
+            }
+            for face in faces
+        ]
+        return compas_ghpython.draw_faces(facets, join=join_faces)
 
     def draw_edges(self, edges=None, color=None):
         """Draw a selection of edges.
@@ -145,28 +130,16 @@ class MeshArtist(GHArtist, MeshArtist):
             The default is None, in which case all edges are drawn.
         color : :class:`~compas.colors.Color` | dict[tuple[int, int], :class:`~compas.colors.Color`], optional
             The color specification for the edges.
-            The default color is the value of :attr:`MeshArtist.default_edgecolor`.
+            Grasshopper lines have no color, so this is ignored.
 
         Returns
         -------
         list[:rhino:`Rhino.Geometry.Line`]
 
         """
-        self.edge_color = color
-        edges = edges or list(self.mesh.edges())
+        edges = edges if edges is not None else self.mesh.edges()
         vertex_xyz = self.vertex_xyz
-        lines = []
-        for edge in edges:
-            u, v = edge
-            lines.append(
-                {
-                    "start": vertex_xyz[u],
-                    "end": vertex_xyz[v],
-                    "color": self.edge_color[edge].rgb255,
-                    "name": "{}.edge.{}-{}".format(self.mesh.name, u, v),
-                }
-            )
-        return compas_ghpython.draw_lines(lines)
+        return compas_ghpython.draw_lines([{"start": vertex_xyz[u], "end": vertex_xyz[v]} for u, v in edges])
 
     def clear_edges(self):
         """GH Artists are state-less. Therefore, clear does not have any effect.
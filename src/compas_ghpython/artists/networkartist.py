@@ -46,26 +46,16 @@ class NetworkArtist(GHArtist, NetworkArtist):
             Default is None, in which case all nodes are drawn.
         color: :class:`~compas.colors.Color` | dict[hashable, :class:`~compas.colors.Color`], optional
             The color specification for the nodes.
-            The default color is :attr:`NetworkArtist.default_nodecolor`.
+            Grasshopper points have no color, so this is ignored.
 
         Returns
         -------
         list[:rhino:`Rhino.Geometry.Point3d`]
 
         """
-        self.node_color = color
         node_xyz = self.node_xyz
-        nodes = nodes or list(self.network.nodes())
-        points = []
-        for node in nodes:
-            points.append(
-                {
-                    "pos": node_xyz[node],
-                    "name": "{}.node.{}".format(self.network.name, node),
-                    "color": self.node_color[node].rgb255,
-                }
-            )
-        return compas_ghpython.draw_points(points)
+        nodes = nodes if nodes is not None else self.network.nodes()
+        return compas_ghpython.draw_points([{"pos": node_xyz[node]} for node in nodes])
 
     def draw_edges(self, edges=None, color=None):
         """Draw a selection of edges.
@@ -77,28 +67,16 @@ class NetworkArtist(GHArtist, NetworkArtist):
             The default is None, in which case all edges are drawn.
         color : :class:`~compas.colors.Color` | dict[tuple[hashable, hashable], :class:`~compas.colors.Color`], optional
             The color specification for the edges.
-            The default color is the value of :attr:`NetworkArtist.default_edgecolor`.
+            Grasshopper lines have no color, so this is ignored.
 
         Returns
         -------
         list[:rhino:`Rhino.Geometry.Line`]
 
         """
-        self.edge_color = color
         node_xyz = self.node_xyz
-        edges = edges or list(self.network.edges())
-        lines = []
-        for edge in edges:
-            u, v = edge
-            lines.append(
-                {
-                    "start": node_xyz[u],
-                    "end": node_xyz[v],
-                    "color": self.edge_color[edge].rgb255,
-                    "name": "{}.edge.{}-{}".format(self.network.name, u, v),
-                }
-            )
-        return compas_ghpython.draw_lines(lines)
+        edges = edges if edges is not None else self.network.edges()
+        return compas_ghpython.draw_lines([{"start": node_xyz[u], "end": node_xyz[v]} for u, v in edges])
 
     def clear_edges(self):
         """GH Artists are state-less. Therefore, clear does not have any effect."""
@@ -45,8 +45,8 @@ class TorusArtist(GHArtist, ShapeArtist):
 
         """
         color = Color.coerce(color) or self.color
-        u = u or self.u
-        v = v or self.v
+        u = u if u is not None else self.u
+        v = v if v is not None else self.v
         vertices, faces = self.shape.to_vertices_and_faces(u=u, v=v)
         vertices = [list(vertex) for vertex in vertices]
         mesh = compas_ghpython.draw_mesh(vertices, faces, color=color.rgb255)
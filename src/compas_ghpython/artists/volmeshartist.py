@@ -54,26 +54,16 @@ class VolMeshArtist(GHArtist, VolMeshArtist):
             Default is None, in which case all vertices are drawn.
         color : :class:`~compas.colors.Color` | dict[int, :class:`~compas.colors.Color`]
             The color specification for the vertices.
-            The default color of the vertices is :attr:`VolMeshArtist.default_vertexcolor`.
+            Grasshopper points have no color, so this is ignored.
 
         Returns
         -------
         list[:rhino:`Rhino.Geometry.Point3d`]
 
         """
-        self.vertex_color = color
-        vertices = vertices or self.vertices
+        vertices = vertices if vertices is not None else self.vertices
         vertex_xyz = self.vertex_xyz
-        points = []
-        for vertex in vertices:
-            points.append(
-                {
-                    "pos": vertex_xyz[vertex],
-                    "name": "{}.vertex.{}".format(self.volmesh.name, vertex),
-                    "color": self.vertex_color[vertex].rgb255,
-                }
-            )
-        return compas_ghpython.draw_points(points)
+        return compas_ghpython.draw_points([{"pos": vertex_xyz[vertex]} for vertex in vertices])
 
     def draw_edges(self, edges=None, color=None):
         """Draw a selection of edges.
@@ -85,28 +75,16 @@ class VolMeshArtist(GHArtist, VolMeshArtist):
             The default is None, in which case all edges are drawn.
         color : :class:`~compas.colors.Color` | dict[tuple[int, int], :class:`~compas.colors.Color`], optional
             The color specification for the edges.
-            The default color is :attr:`VolMeshArtist.default_edgecolor`.
+            Grasshopper lines have no color, so this is ignored.
 
         Returns
         -------
         list[:rhino:`Rhino.Geometry.Line`]
 
         """
-        self.edge_color = color
-        edges = edges or self.edges
+        edges = edges if edges is not None else self.edges
         vertex_xyz = self.vertex_xyz
-        lines = []
-        for edge in edges:
-            u, v = edge
-            lines.append(
-                {
-                    "start": vertex_xyz[u],
-                    "end": vertex_xyz[v],
-                    "color": self.edge_color[edge].rgb255,
-                    "name": "{}.edge.{}-{}".format(self.volmesh.name, u, v),
-                }
-            )
-        return compas_ghpython.draw_lines(lines)
+        return compas_ghpython.draw_lines([{"start": vertex_xyz[u], "end": vertex_xyz[v]} for u, v in edges])
 
     def draw_faces(self, faces=None, color=None, join_faces=False):
         """Draw a selection of faces.
@@ -128,14 +106,13 @@ class VolMeshArtist(GHArtist, VolMeshArtist):
 
         """
         self.face_color = color
-        faces = faces or self.faces
+        faces = faces if faces is not None else self.faces
         vertex_xyz = self.vertex_xyz
         facets = []
         for face in faces:
             facets.append(
                 {
                     "points": [vertex_xyz[vertex] for vertex in self.volmesh.halfface_vertices(face)],
-                    "name": "{}.face.{}".format(self.volmesh.name, face),
                     "color": self.face_color[face].rgb255,
                 }
             )
@@ -159,7 +136,7 @@ class VolMeshArtist(GHArtist, VolMeshArtist):
 
         """
         self.cell_color = color
-        cells = cells or self.cells
+        cells = cells if cells is not None else self.cells
         vertex_xyz = self.vertex_xyz
         meshes = []
         for cell in cells:
@@ -10,6 +10,7 @@ from Rhino.Geometry import Curve
 from Rhino.Geometry import Cylinder
 from Rhino.Geometry import Line
 from Rhino.Geometry import Mesh
+from Rhino.Geometry import MeshFace
 from Rhino.Geometry import PipeCapMode
 from Rhino.Geometry import Plane
 from Rhino.Geometry import Point2f
@@ -23,8 +24,9 @@ from System.Drawing import Color
 from System.Enum import ToObject
 
 from compas.geometry import centroid_points
+from compas.geometry import centroid_polygon
 from compas.utilities import pairwise
-from compas_rhino.utilities.drawing import _face_to_max_quad
+from compas_rhino.utilities.drawing import _face_to_fan_triangles
 
 try:
     from Rhino.Geometry import MeshNgon
@@ -164,13 +166,16 @@ def draw_polylines(polylines):
     return rg_polylines
 
 
-def draw_faces(faces):
+def draw_faces(faces, join=False):
     """Draw polygonal faces as Meshes.
 
     Parameters
     ----------
     faces : list of dict
         The face definitions.
+    join : bool, optional
+        If True, draw all faces as disjoint parts of a single mesh.
+        The mesh only has vertex colors if every face has a color or vertex colors.
 
     Returns
     -------
@@ -182,37 +187,108 @@ def draw_faces(faces):
 
         Schema({
             'points': lambda x: all(len(y) == 3 for y in x),
+            Optional('color', default=None): lambda x: len(x) == 3,
             Optional('vertexcolors', default=None): lambda x: all(len(y) == 3 for y in x)
         })
 
     """
+    if join:
+        return [_draw_joined_faces(faces)]
     meshes = []
     for face in iter(faces):
         points = face["points"][:]
+        color = face.get("color")
         vertexcolors = face.get("vertexcolors")
         v = len(points)
         if v < 3:
             continue
         if v == 3:
-            mfaces = [[0, 1, 2, 2]]
+            mfaces = [[0, 1, 2]]
         elif v == 4:
             mfaces = [[0, 1, 2, 3]]
         else:
-            mfaces = _face_to_max_quad(points, range(v))
+            mfaces = _face_to_fan_triangles(points, range(v))
             if vertexcolors:
-                r, g, b = [sum(component) / v for component in zip(*vertexcolors)]
-                r = int(min(max(0, r), 255))
-                g = int(min(max(0, g), 255))
-                b = int(min(max(0, b), 255))
-                vertexcolors.append((r, g, b))
+                vertexcolors.append(_average_color(vertexcolors))
         if vertexcolors:
             mesh = draw_mesh(points, mfaces, color=vertexcolors)
         else:
-            mesh = draw_mesh(points, mfaces)
+            mesh = draw_mesh(points, mfaces, color=color)
         meshes.append(mesh)
     return meshes
 
 
+def _draw_joined_faces(faces):
+    faces = [face for face in faces if len(face["points"]) > 2]
+    vcount = 0
+    fcount = 0
+    for face in faces:
+        v = len(face["points"])
+        if v < 5:
+            vcount += v
+            fcount += 1
+        else:
+            vcount += v + 1
+            fcount += v
+
+    vertices = CreateInstance(Point3d, vcount)
+    mfaces = CreateInstance(MeshFace, fcount)
+    colored = all(face.get("vertexcolors") or face.get("color") for face in faces)
+    colors = CreateInstance(Color, vcount if colored else 0)
+    i = 0
+    j = 0
+    for face in faces:
+        points = face["points"]
+        v = len(points)
+        for k, point in enumerate(points):
+            vertices[i + k] = Point3d(*point)
+        if colored:
+            vertexcolors = face.get("vertexcolors")
+            if vertexcolors:
+                for k, color in enumerate(vertexcolors):
+                    colors[i + k] = rs.coercecolor(color)
+            else:
+                color = rs.coercecolor(face["color"])
+                for k in range(v):
+                    colors[i + k] = color
+        if v == 3:
+            mfaces[j] = MeshFace(i, i + 1, i + 2)
+            j += 1
+        elif v == 4:
+            mfaces[j] = MeshFace(i, i + 1, i + 2, i + 3)
+            j += 1
+        else:
+            c = i + v
+            vertices[c] = Point3d(*centroid_polygon(points))
+            if colored and vertexcolors:
+                colors[c] = rs.coercecolor(_average_color(vertexcolors))
+            elif colored:
+                colors[c] = colors[i]
+            for k in range(v):
+                mfaces[j] = MeshFace(c, i + k, i + (k + 1) % v)
+                j += 1
+            v += 1
+        i += v
+
+    mesh = Mesh()
+    mesh.Vertices.Capacity = vcount
+    mesh.Faces.Capacity = fcount
+    mesh.Vertices.AddVertices(vertices)
+    mesh.Faces.AddFaces(mfaces)
+    if colored:
+        mesh.VertexColors.SetColors(colors)
+    return mesh
+
+
+def _average_color(colors):
+    n = len(colors)
+    r, g, b = [sum(component) / n for component in zip(*colors)]
+    r = int(min(max(0, r), 255))
+    g = int(min(max(0, g), 255))
+    b = int(min(max(0, b), 255))
+    return r, g, b
+
+
 def draw_cylinders(cylinders, cap=False):
     """Draw cylinders.
 
@@ -396,8 +472,9 @@ def draw_mesh(vertices, faces, color=None, vertex_normals=None, texture_coordina
     if color:
         count = len(mesh.Vertices)
         colors = CreateInstance(Color, count)
+        color = rs.coercecolor(color)
         for i in range(count):
-            colors[i] = rs.coercecolor(color)
+            colors[i] = color
         mesh.VertexColors.SetColors(colors)
 
     return mesh
@@ -4,6 +4,11 @@ from __future__ import division
 
 import compas_rhino
 from compas.artists import ShapeArtist
+from compas.geometry import Circle
+from compas.geometry import Cone
+from compas.geometry import Frame
+from compas.geometry import Plane
+from compas.geometry import Transformation
 from compas.colors import Color
 from .artist import RhinoArtist
 
@@ -26,7 +31,7 @@ class ConeArtist(RhinoArtist, ShapeArtist):
     def __init__(self, cone, layer=None, **kwargs):
         super(ConeArtist, self).__init__(shape=cone, layer=layer, **kwargs)
 
-    def draw(self, color=None, u=None):
+    def draw(self, color=None, u=None, instance=False):
         """Draw the cone associated with the artist.
 
         Parameters
@@ -37,6 +42,9 @@ class ConeArtist(RhinoArtist, ShapeArtist):
         u : int, optional
             Number of faces in the "u" direction.
             Default is :attr:`ConeArtist.u`.
+        instance : bool, optional
+            If True, draw the cone as a reference to a block definition
+            that is shared by all cones with the same resolution, radius, and height.
 
         Returns
         -------
@@ -45,9 +53,27 @@ class ConeArtist(RhinoArtist, ShapeArtist):
 
         """
         color = Color.coerce(color) or self.color
-        u = u or self.u
+        u = u if u is not None else self.u
+        if instance:
+            radius = self.shape.circle.radius
+            height = self.shape.height
+
+            def geometry():
+                return Cone(Circle(Plane.worldXY(), radius), height).to_vertices_and_faces(u=u)
+
+            world = Transformation.from_frame(Frame.from_plane(self.shape.circle.plane))
+            local = Transformation.from_frame(Frame.from_plane(Plane.worldXY()))
+            block = "Cone.u{}.r{}.h{}".format(u, radius, height)
+            guid = compas_rhino.draw_mesh_instance(
+                block,
+                geometry,
+                matrix=(world * local.inverse()).matrix,
+                layer=self.layer,
+                name=self.shape.name,
+                color=color.rgb255,
+            )
+            return [guid]
         vertices, faces = self.shape.to_vertices_and_faces(u=u)
-        vertices = [list(vertex) for vertex in vertices]
         guid = compas_rhino.draw_mesh(
             vertices,
             faces,
@@ -45,7 +45,7 @@ class CylinderArtist(RhinoArtist, ShapeArtist):
 
         """
         color = Color.coerce(color) or self.color
-        u = u or self.u
+        u = u if u is not None else self.u
         vertices, faces = self.shape.to_vertices_and_faces(u=u)
         vertices = [list(vertex) for vertex in vertices]
         guid = compas_rhino.draw_mesh(
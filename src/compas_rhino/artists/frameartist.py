@@ -41,7 +41,7 @@ class FrameArtist(RhinoArtist, PrimitiveArtist):
 
     def __init__(self, frame, layer=None, scale=1.0, **kwargs):
         super(FrameArtist, self).__init__(primitive=frame, layer=layer, **kwargs)
-        self.scale = scale or 1.0
+        self.scale = scale if scale is not None else 1.0
         self.color_origin = Color.black()
         self.color_xaxis = Color.red()
         self.color_yaxis = Color.green()
@@ -56,12 +56,11 @@ class FrameArtist(RhinoArtist, PrimitiveArtist):
             The GUIDs of the created Rhino objects.
 
         """
-        points = []
-        lines = []
-        origin = list(self.primitive.point)
-        X = list(self.primitive.point + self.primitive.xaxis.scaled(self.scale))
-        Y = list(self.primitive.point + self.primitive.yaxis.scaled(self.scale))
-        Z = list(self.primitive.point + self.primitive.zaxis.scaled(self.scale))
+        frame = self.primitive
+        scale = self.scale
+        x, y, z = frame.point
+        origin = [x, y, z]
+        X, Y, Z = [[x + u * scale, y + v * scale, z + w * scale] for u, v, w in (frame.xaxis, frame.yaxis, frame.zaxis)]
         points = [{"pos": origin, "color": self.color_origin.rgb255}]
         lines = [
             {
@@ -195,7 +195,7 @@ class MeshArtist(RhinoArtist, MeshArtist):
 
         """
         self.vertex_color = color
-        vertices = vertices or self.vertices
+        vertices = vertices if vertices is not None else self.vertices
         vertex_xyz = self.vertex_xyz
         points = []
         for vertex in vertices:
@@ -227,7 +227,7 @@ class MeshArtist(RhinoArtist, MeshArtist):
 
         """
         self.edge_color = color
-        edges = edges or self.edges
+        edges = edges if edges is not None else self.edges
         vertex_xyz = self.vertex_xyz
         lines = []
         for edge in edges:
@@ -263,7 +263,7 @@ class MeshArtist(RhinoArtist, MeshArtist):
 
         """
         self.face_color = color
-        faces = faces or self.faces
+        faces = faces if faces is not None else self.faces
         vertex_xyz = self.vertex_xyz
         facets = []
         for face in faces:
@@ -309,7 +309,7 @@ class MeshArtist(RhinoArtist, MeshArtist):
         """
         color = Color.coerce(color).rgb255
         vertex_xyz = self.vertex_xyz
-        vertices = vertices or self.vertices
+        vertices = vertices if vertices is not None else self.vertices
         lines = []
         for vertex in vertices:
             a = vertex_xyz[vertex]
@@ -347,7 +347,7 @@ class MeshArtist(RhinoArtist, MeshArtist):
         """
         color = Color.coerce(color).rgb255
         vertex_xyz = self.vertex_xyz
-        faces = faces or self.faces
+        faces = faces if faces is not None else self.faces
         lines = []
         for face in faces:
             a = centroid_points([vertex_xyz[vertex] for vertex in self.mesh.face_vertices(face)])
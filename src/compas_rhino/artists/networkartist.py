@@ -138,7 +138,7 @@ class NetworkArtist(RhinoArtist, NetworkArtist):
 
         """
         self.node_color = color
-        nodes = nodes or self.nodes
+        nodes = nodes if nodes is not None else self.nodes
         node_xyz = self.node_xyz
         points = []
         for node in nodes:
@@ -170,7 +170,7 @@ class NetworkArtist(RhinoArtist, NetworkArtist):
 
         """
         self.edge_color = color
-        edges = edges or self.edges
+        edges = edges if edges is not None else self.edges
         node_xyz = self.node_xyz
         lines = []
         for edge in edges:
@@ -162,7 +162,7 @@ class VolMeshArtist(RhinoArtist, VolMeshArtist):
 
         """
         self.vertex_color = color
-        vertices = vertices or self.vertices
+        vertices = vertices if vertices is not None else self.vertices
         vertex_xyz = self.vertex_xyz
         points = []
         for vertex in vertices:
@@ -194,7 +194,7 @@ class VolMeshArtist(RhinoArtist, VolMeshArtist):
 
         """
         self.edge_color = color
-        edges = edges or self.edges
+        edges = edges if edges is not None else self.edges
         vertex_xyz = self.vertex_xyz
         lines = []
         for edge in edges:
@@ -227,7 +227,7 @@ class VolMeshArtist(RhinoArtist, VolMeshArtist):
 
         """
         self.face_color = color
-        faces = faces or self.faces
+        faces = faces if faces is not None else self.faces
         vertex_xyz = self.vertex_xyz
         facets = []
         for face in faces:
@@ -260,7 +260,7 @@ class VolMeshArtist(RhinoArtist, VolMeshArtist):
 
         """
         self.cell_color = color
-        cells = cells or self.cells
+        cells = cells if cells is not None else self.cells
         vertex_xyz = self.vertex_xyz
         guids = []
         for cell in cells:
@@ -72,6 +72,7 @@ drawing
     draw_pipes
     draw_spheres
     draw_mesh
+    draw_mesh_instance
     draw_curves
     draw_surfaces
 
@@ -195,6 +196,7 @@ from .drawing import (
     draw_pipes,
     draw_spheres,
     draw_mesh,
+    draw_mesh_instance,
     draw_circles,
     draw_curves,
     draw_surfaces,
@@ -295,6 +297,7 @@ __all__ = [
     "draw_pipes",
     "draw_spheres",
     "draw_mesh",
+    "draw_mesh_instance",
     "draw_circles",
     "draw_curves",
     "draw_surfaces",
@@ -7,7 +7,6 @@ from functools import wraps
 import compas_rhino
 
 from compas.geometry import centroid_polygon
-from compas.utilities import pairwise
 
 from compas_rhino.utilities import create_layers_from_path
 from compas_rhino.utilities import clear_layer
@@ -35,6 +34,7 @@ from Rhino.Geometry import PipeCapMode
 from Rhino.Geometry import Curve
 from Rhino.Geometry import Sphere
 from Rhino.Geometry import TextDot
+from Rhino.Geometry import Transform
 from Rhino.Geometry import Mesh as RhinoMesh
 
 try:
@@ -42,8 +42,10 @@ try:
 except ImportError:
     MeshNgon = False
 
+from Rhino.DocObjects import ObjectAttributes
 from Rhino.DocObjects.ObjectColorSource import ColorFromObject
 from Rhino.DocObjects.ObjectColorSource import ColorFromLayer
+from Rhino.DocObjects.ObjectColorSource import ColorFromParent
 from Rhino.DocObjects.ObjectDecoration import EndArrowhead
 from Rhino.DocObjects.ObjectDecoration import StartArrowhead
 from Rhino.DocObjects.ObjectPlotWeightSource import PlotWeightFromObject
@@ -59,6 +61,7 @@ add_sphere = sc.doc.Objects.AddSphere
 add_mesh = sc.doc.Objects.AddMesh
 add_circle = sc.doc.Objects.AddCircle
 add_surface = sc.doc.Objects.AddSurface
+add_instance = sc.doc.Objects.AddInstanceObject
 
 TOL = sc.doc.ModelAbsoluteTolerance
 
@@ -80,6 +83,7 @@ __all__ = [
     "draw_pipes",
     "draw_spheres",
     "draw_mesh",
+    "draw_mesh_instance",
     "draw_circles",
     "draw_surfaces",
     "draw_brep",
@@ -756,9 +760,8 @@ def draw_spheres(spheres, **kwargs):
     return guids
 
 
-@wrap_drawfunc
-def draw_mesh(vertices, faces, name=None, color=None, vertex_color=None, disjoint=False, **kwargs):
-    """Draw a mesh and optionally set individual name, color, and layer properties.
+def _mesh_from_vertices_and_faces(vertices, faces, color=None, vertex_color=None, disjoint=False):
+    """Construct a Rhino mesh without adding it to the document.
 
     Parameters
     ----------
@@ -766,20 +769,19 @@ def draw_mesh(vertices, faces, name=None, color=None, vertex_color=None, disjoin
         A list of point locations.
     faces : list[list[int]]
         A list of faces as lists of indices into `vertices`.
-    name : str, optional
-        The name of the mesh object in Rhino.
     color : tuple[[int, int, int]], optional
         The base color of the mesh.
     vertex_color : dict[int, tuple[int, int, int]], optional
         A color per vertex of the mesh.
-        Vertices without a color specification in this mapping, will receive the base color.
-        For example: ``vertex_color = {vertex: Color.from_i(random.random()).rgb255 for face in faces for vertex in face}``
     disjoint : bool, optional
-        If True, draw the mesh with disjoint faces.
+        If True, construct the mesh with disjoint faces.
 
     Returns
     -------
-    System.Guid
+    :rhino:`Rhino.Geometry.Mesh`
+        The mesh.
+    list[tuple[int, int, int]]
+        The colors of the vertices of the mesh.
 
     """
 
@@ -794,6 +796,8 @@ def draw_mesh(vertices, faces, name=None, color=None, vertex_color=None, disjoin
     vertex_color = vertex_color or {}
     vertexcolors = []
     mesh = RhinoMesh()
+    add_vertex = mesh.Vertices.Add
+    add_face = mesh.Faces.AddFace
 
     if disjoint:
         for face in faces:
@@ -801,45 +805,44 @@ def draw_mesh(vertices, faces, name=None, color=None, vertex_color=None, disjoin
             if f < 3:
                 continue
             if f == 3:
-                a = mesh.Vertices.Add(*vertices[face[0]])
-                b = mesh.Vertices.Add(*vertices[face[1]])
-                c = mesh.Vertices.Add(*vertices[face[2]])
+                a = add_vertex(*vertices[face[0]])
+                b = add_vertex(*vertices[face[1]])
+                c = add_vertex(*vertices[face[2]])
                 vertexcolors.append(vertex_color.get(face[0], color))
                 vertexcolors.append(vertex_color.get(face[1], color))
                 vertexcolors.append(vertex_color.get(face[2], color))
-                mesh.Faces.AddFace(a, b, c)
+                add_face(a, b, c)
             elif f == 4:
-                a = mesh.Vertices.Add(*vertices[face[0]])
-                b = mesh.Vertices.Add(*vertices[face[1]])
-                c = mesh.Vertices.Add(*vertices[face[2]])
-                d = mesh.Vertices.Add(*vertices[face[3]])
+                a = add_vertex(*vertices[face[0]])
+                b = add_vertex(*vertices[face[1]])
+                c = add_vertex(*vertices[face[2]])
+                d = add_vertex(*vertices[face[3]])
                 vertexcolors.append(vertex_color.get(face[0], color))
                 vertexcolors.append(vertex_color.get(face[1], color))
                 vertexcolors.append(vertex_color.get(face[2], color))
                 vertexcolors.append(vertex_color.get(face[3], color))
-                mesh.Faces.AddFace(a, b, c, d)
+                add_face(a, b, c, d)
             else:
                 if MeshNgon:
-                    cornercolors = [vertex_color.get(vertex, color) for vertex in face]
-                    vertexcolors += cornercolors
-                    vertexcolors.append(average_color(cornercolors))
+                    if vertex_color:
+                        cornercolors = [vertex_color.get(vertex, color) for vertex in face]
+                        vertexcolors += cornercolors
+                        vertexcolors.append(average_color(cornercolors))
+                    else:
+                        vertexcolors += [color] * (f + 1)
 
                     points = [vertices[vertex] for vertex in face]
                     centroid = centroid_polygon(points)
-                    indices = []
-                    for point in points:
-                        indices.append(mesh.Vertices.Add(*point))
-                    c = mesh.Vertices.Add(*centroid)
-
-                    facets = []
-                    for i, j in pairwise(indices + indices[:1]):
-                        facets.append(mesh.Faces.AddFace(i, j, c))
+                    indices = [add_vertex(*point) for point in points]
+                    c = add_vertex(*centroid)
+
+                    facets = [add_face(indices[i], indices[(i + 1) % f], c) for i in range(f)]
                     ngon = MeshNgon.Create(indices, facets)
                     mesh.Ngons.AddNgon(ngon)
 
     else:
         for index, (x, y, z) in enumerate(vertices):
-            mesh.Vertices.Add(x, y, z)
+            add_vertex(x, y, z)
             vertexcolors.append(vertex_color.get(index, color))
 
         for face in faces:
@@ -847,26 +850,64 @@ def draw_mesh(vertices, faces, name=None, color=None, vertex_color=None, disjoin
             if f < 3:
                 continue
             if f == 3:
-                mesh.Faces.AddFace(*face)
+                add_face(*face)
             elif f == 4:
-                mesh.Faces.AddFace(*face)
+                add_face(*face)
             else:
                 if MeshNgon:
-                    cornercolors = [vertex_color.get(index, color) for index in face]
-                    vertexcolors.append(average_color(cornercolors))
+                    if vertex_color:
+                        cornercolors = [vertex_color.get(index, color) for index in face]
+                        vertexcolors.append(average_color(cornercolors))
+                    else:
+                        vertexcolors.append(color)
 
                     centroid = centroid_polygon([vertices[index] for index in face])
-                    c = mesh.Vertices.Add(*centroid)
+                    c = add_vertex(*centroid)
 
-                    facets = []
-                    for i, j in pairwise(face + face[:1]):
-                        facets.append(mesh.Faces.AddFace(i, j, c))
+                    facets = [add_face(face[i], face[(i + 1) % f], c) for i in range(f)]
                     ngon = MeshNgon.Create(face, facets)
                     mesh.Ngons.AddNgon(ngon)
 
     mesh.Normals.ComputeNormals()
     mesh.Compact()
 
+    return mesh, vertexcolors
+
+
+@wrap_drawfunc
+def draw_mesh(vertices, faces, name=None, color=None, vertex_color=None, disjoint=False, **kwargs):
+    """Draw a mesh and optionally set individual name, color, and layer properties.
+
+    Parameters
+    ----------
+    vertices : list[[float, float, float] | :class:`~compas.geometry.Point`]
+        A list of point locations.
+    faces : list[list[int]]
+        A list of faces as lists of indices into `vertices`.
+    name : str, optional
+        The name of the mesh object in Rhino.
+    color : tuple[[int, int, int]], optional
+        The base color of the mesh.
+    vertex_color : dict[int, tuple[int, int, int]], optional
+        A color per vertex of the mesh.
+        Vertices without a color specification in this mapping, will receive the base color.
+        For example: ``vertex_color = {vertex: Color.from_i(random.random()).rgb255 for face in faces for vertex in face}``
+    disjoint : bool, optional
+        If True, draw the mesh with disjoint faces.
+
+    Returns
+    -------
+    System.Guid
+
+    """
+    mesh, vertexcolors = _mesh_from_vertices_and_faces(
+        vertices,
+        faces,
+        color=color,
+        vertex_color=vertex_color,
+        disjoint=disjoint,
+    )
+
     guid = add_mesh(mesh)
 
     if guid != System.Guid.Empty:
@@ -890,6 +931,74 @@ def draw_mesh(vertices, faces, name=None, color=None, vertex_color=None, disjoin
         return guid
 
 
+@wrap_drawfunc
+def draw_mesh_instance(block, geometry, matrix=None, name=None, color=None, **kwargs):
+    """Draw a mesh as an instance of a shared block definition and optionally set name, color, and layer properties.
+
+    Parameters
+    ----------
+    block : str
+        The name of the block definition.
+    geometry : callable
+        A function without arguments that returns the vertices and faces of the mesh,
+        in the coordinate system of the block definition.
+        The vertices are a list of point locations, and the faces a list of lists of indices into the vertices.
+    matrix : list[list[float]], optional
+        The 4x4 transformation matrix, in row-major order,
+        from the coordinate system of the block definition to the world coordinate system.
+        Default is the identity matrix.
+    name : str, optional
+        The name of the block instance in Rhino.
+    color : tuple[[int, int, int]], optional
+        The color of the block instance.
+
+    Returns
+    -------
+    System.Guid
+
+    Notes
+    -----
+    `geometry` is only called to create the block definition from a disjoint mesh
+    if no block definition with the given name exists yet in the document.
+    Otherwise, the existing definition is reused.
+    It is the responsibility of the caller to use block names that identify the mesh geometry uniquely.
+
+    """
+    definition = sc.doc.InstanceDefinitions.Find(block)
+    if definition:
+        index = definition.Index
+    else:
+        vertices, faces = geometry()
+        mesh, _ = _mesh_from_vertices_and_faces(vertices, faces, disjoint=True)
+        attr = ObjectAttributes()
+        attr.ColorSource = ColorFromParent
+        index = sc.doc.InstanceDefinitions.Add(block, "", Point3d(0, 0, 0), [mesh], [attr])
+        if index < 0:
+            return
+
+    xform = Transform(1.0)
+    if matrix:
+        for i in range(4):
+            for j in range(4):
+                xform[i, j] = matrix[i][j]
+
+    guid = add_instance(index, xform)
+
+    if guid != System.Guid.Empty:
+        obj = find_object(guid)
+        if obj:
+            attr = obj.Attributes
+            if color:
+                attr.ObjectColor = FromArgb(*color)
+                attr.ColorSource = ColorFromObject
+            else:
+                attr.ColorSource = ColorFromLayer
+            if name:
+                attr.Name = name
+            obj.CommitChanges()
+        return guid
+
+
 @wrap_drawfunc
 def draw_faces(faces, **kwargs):
     """Draw faces as individual meshes and optionally set individual name, color, and layer properties.
@@ -930,7 +1039,7 @@ def draw_faces(faces, **kwargs):
         if v < 3:
             continue
         elif v == 3:
-            mfaces = [[0, 1, 2, 2]]
+            mfaces = [[0, 1, 2]]
         elif v == 4:
             mfaces = [[0, 1, 2, 3]]
         else:
@@ -957,14 +1066,14 @@ def draw_faces(faces, **kwargs):
     return guids
 
 
-def _face_to_max_quad(points, face):
+def _face_to_fan_triangles(points, face):
     faces = []
     c = len(points)
     points.append(centroid_polygon(points))
     for i in range(-1, len(face) - 1):
         a = face[i]
         b = face[i + 1]
-        faces.append([c, a, b, b])
+        faces.append([c, a, b])
     return faces
 
 